@@ -1,157 +1,305 @@
+import array
 import asyncio
+import io
 import json
+import logging
+import mmap
 import os
 import sys
-import math
-from dotenv import load_dotenv
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-
-load_dotenv()
-
-# Position data for all chess squares with forward distances and rotation angles
-POSITION_DATA = {
-    # Column A (left edge, 90 degrees left rotation)
-    "a8": {"forward": 30, "rotation": -90},
-    "a7": {"forward": 70, "rotation": -90},
-    "a6": {"forward": 120, "rotation": -90},
-    "a5": {"forward": 150, "rotation": -90},
-    "a4": {"forward": 180, "rotation": -90},
-    "a3": {"forward": 210, "rotation": -90},
-    "a2": {"forward": 240, "rotation": -90},
-    "a1": {"forward": 270, "rotation": -90},
-    
-    # Column B (45 degrees left rotation)
-    "b8": {"forward": 42, "rotation": -45},
-    "b7": {"forward": 98, "rotation": -45},
-    "b6": {"forward": 169, "rotation": -45},
-    "b5": {"forward": 212, "rotation": -45},
-    "b4": {"forward": 254, "rotation": -45},
-    "b3": {"forward": 297, "rotation": -45},
-    "b2": {"forward": 339, "rotation": -45},
-    "b1": {"forward": 382, "rotation": -45},
-    
-    # Column C (22 degrees left rotation)
-    "c8": {"forward": 32, "rotation": -22},
-    "c7": {"forward": 76, "rotation": -22},
-    "c6": {"forward": 130, "rotation": -22},
-    "c5": {"forward": 163, "rotation": -22},
-    "c4": {"forward": 195, "rotation": -22},
-    "c3": {"forward": 228, "rotation": -22},
-    "c2": {"forward": 260, "rotation": -22},
-    "c1": {"forward": 292, "rotation": -22},
-    
-    # Column D (no rotation, robot aligned)
-    "d8": {"forward": 30, "rotation": 0},
-    "d7": {"forward": 70, "rotation": 0},
-    "d6": {"forward": 120, "rotation": 0},
-    "d5": {"forward": 150, "rotation": 0},
-    "d4": {"forward": 180, "rotation": 0},
-    "d3": {"forward": 210, "rotation": 0},
-    "d2": {"forward": 240, "rotation": 0},
-    "d1": {"forward": 270, "rotation": 0},
-    
-    # Column E (22 degrees right rotation)
-    "e8": {"forward": 32, "rotation": 22},
-    "e7": {"forward": 76, "rotation": 22},
-    "e6": {"forward": 130, "rotation": 22},
-    "e5": {"forward": 163, "rotation": 22},
-    "e4": {"forward": 195, "rotation": 22},
-    "e3": {"forward": 228, "rotation": 22},
-    "e2": {"forward": 260, "rotation": 22},
-    "e1": {"forward": 292, "rotation": 22},
-    
-    # Column F (45 degrees right rotation)
-    "f8": {"forward": 42, "rotation": 45},
-    "f7": {"forward": 98, "rotation": 45},
-    "f6": {"forward": 169, "rotation": 45},
-    "f5": {"forward": 212, "rotation": 45},
-    "f4": {"forward": 254, "rotation": 45},
-    "f3": {"forward": 297, "rotation": 45},
-    "f2": {"forward": 339, "rotation": 45},
-    "f1": {"forward": 382, "rotation": 45},
-    
-    # Column G (67 degrees right rotation)
-    "g8": {"forward": 78, "rotation": 67},
-    "g7": {"forward": 179, "rotation": 67},
-    "g6": {"forward": 307, "rotation": 67},
-    "g5": {"forward": 384, "rotation": 67},
-    "g4": {"forward": 461, "rotation": 67},
-    "g3": {"forward": 538, "rotation": 67},
-    "g2": {"forward": 614, "rotation": 67},
-    "g1": {"forward": 691, "rotation": 67},
-    
-    # Column H (90 degrees right rotation)
-    "h8": {"forward": 30, "rotation": 90},
-    "h7": {"forward": 70, "rotation": 90},
-    "h6": {"forward": 120, "rotation": 90},
-    "h5": {"forward": 150, "rotation": 90},
-    "h4": {"forward": 180, "rotation": 90},
-    "h3": {"forward": 210, "rotation": 90},
-    "h2": {"forward": 240, "rotation": 90},
-    "h1": {"forward": 270, "rotation": 90},
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("robot")
+
+# Robot rotation angle for each column a-h; every square in a column shares it
+ROTATIONS = (-90, -45, -22, 0, 22, 45, 67, 90)
+
+# Forward distance (mm) for each square: FORWARDS[column][row], rows 1-8
+FORWARDS = (
+    (270, 240, 210, 180, 150, 120, 70, 30),  # Column A (left edge, 90 degrees left rotation)
+    (382, 339, 297, 254, 212, 169, 98, 42),  # Column B (45 degrees left rotation)
+    (292, 260, 228, 195, 163, 130, 76, 32),  # Column C (22 degrees left rotation)
+    (270, 240, 210, 180, 150, 120, 70, 30),  # Column D (no rotation, robot aligned)
+    (292, 260, 228, 195, 163, 130, 76, 32),  # Column E (22 degrees right rotation)
+    (382, 339, 297, 254, 212, 169, 98, 42),  # Column F (45 degrees right rotation)
+    (691, 614, 538, 461, 384, 307, 179, 78),  # Column G (67 degrees right rotation)
+    (270, 240, 210, 180, 150, 120, 70, 30),  # Column H (90 degrees right rotation)
+)
+
+def _sqid(position):
+    """Map a square like 'e4' to an index 0-63 (column-major, a1 = 0)."""
+    return (ord(position[0]) - 97) << 3 | (ord(position[1]) - 49)
+
+def _square_name(sq_id):
+    """Inverse of _sqid()."""
+    return chr(97 + (sq_id >> 3)) + chr(49 + (sq_id & 7))
+
+# Flat int16 table of (forward, rotation) pairs, two entries per _sqid().
+# POS[0::2] are all forward distances, POS[1::2] all rotations.
+POS = array.array('h', (
+    value
+    for column, rotation in zip(FORWARDS, ROTATIONS)
+    for forward in column
+    for value in (forward, rotation)
+))
+
+def square_geometry(sq_id):
+    """(forward distance, rotation angle) pair for a square id."""
+    i = sq_id << 1
+    return POS[i], POS[i + 1]
+
+VALID_POSITIONS = frozenset(f"{c}{r}" for c in "abcdefgh" for r in "12345678")
+
+COMMANDS_FILE = "command.json"
+
+# Tools that drive their own actuator and may overlap a step of a *different*
+# tool. Two steps of the same tool never overlap: move_robot drives every arm
+# joint through one controller on the server, and control_gripper drives the
+# single gripper servo. Read once, when sequences are frozen into groups by
+# _group_steps().
+PARALLEL_SAFE = {
+    "move_robot": True,
+    "control_gripper": True,
+}
+
+# Minimum time (seconds) from sending a tool call until the next step may
+# start. Calls that already took longer are not delayed further.
+SETTLE_S = {
+    "move_robot": 0.1,
+    "control_gripper": 0.05,
 }
 
-async def execute_robot_sequence(sequence):
-    """Execute a sequence of robot movements using MCP server."""
+# A frozen sequence is a tuple of groups, each a tuple of steps sent together.
+# Every frozen step is a (kind, payload) tuple:
+#   (STEP_TOOL, (tool_name, args, parallel)) or (STEP_WAIT, seconds)
+STEP_TOOL = 0
+STEP_WAIT = 1
+
+@lru_cache(maxsize=None)
+def _step(tool, argkey, parallel=False):
+    """Shared read-only step for a tool and its sorted (name, value) arg pairs."""
+    return (STEP_TOOL, (tool, MappingProxyType(dict(argkey)), parallel))
+
+def _argkey(args):
+    """Hashable, interned form of an args dict, with values coerced to str."""
+    return tuple(sorted((sys.intern(key), sys.intern(str(value))) for key, value in args.items()))
+
+def _freeze_step(step):
+    """Convert a JSON step dict into its (kind, payload) form with args coerced to str."""
+    if not isinstance(step, dict):
+        raise ValueError(f"Step must be an object, got {step!r}")
+    if "wait" in step:
+        return (STEP_WAIT, step["wait"])
+    if not isinstance(step.get("tool"), str) or not isinstance(step.get("args"), dict):
+        raise ValueError(f"Step needs a 'tool' name and an 'args' object: {step!r}")
+    return _step(sys.intern(step["tool"]), _argkey(step["args"]), bool(step.get("parallel")))
+
+class Commands(NamedTuple):
+    """Frozen contents of command.json."""
+    named: MappingProxyType  # command name -> sequence
+    squares: tuple  # _sqid() -> sequence, or None if the square is missing
+
+@lru_cache(maxsize=1)
+def _load_commands(mtime):
+    """Parse and freeze the command file; cached on its mtime so edits are picked up."""
+    with open(COMMANDS_FILE, 'rb') as file:
+        if orjson is not None:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                raw = orjson.loads(view)
+        else:
+            raw = json.load(file)
+    # Shape errors surface as ValueError, like a JSON syntax error
+    if not isinstance(raw, dict):
+        raise ValueError("command.json must be an object of command name -> step list")
+    for name, steps in raw.items():
+        if not isinstance(steps, list):
+            raise ValueError(f"Command '{name}' must be a list of steps")
+    commands = MappingProxyType({
+        name: _group_steps(_freeze_step(step) for step in steps)
+        for name, steps in raw.items()
+    })
+    # Square sequences again, indexed by _sqid() instead of by name
+    squares = [None] * 64
+    for name, sequence in commands.items():
+        if name in VALID_POSITIONS:
+            squares[_sqid(name)] = sequence
+    return Commands(commands, tuple(squares))
+
+def _parallel_safe(step):
+    """Whether a step's tool may share a group with steps of other tools."""
+    kind, payload = step
+    return kind == STEP_TOOL and PARALLEL_SAFE.get(payload[0], False)
+
+def _settle_time(step):
+    """Minimum interval before the step after this one may start."""
+    kind, payload = step
+    return SETTLE_S.get(payload[0], 0) if kind == STEP_TOOL else 0
+
+def _sequence_tools(sequence):
+    """Set of tools used by a frozen sequence."""
+    return {payload[0] for group in sequence for kind, payload in group if kind == STEP_TOOL}
+
+def _can_overlap(first, second):
+    """Whether two frozen sequences drive different actuators and may run together."""
+    first_tools, second_tools = _sequence_tools(first), _sequence_tools(second)
+    return first_tools.isdisjoint(second_tools) and all(
+        PARALLEL_SAFE.get(tool, False) for tool in first_tools | second_tools
+    )
+
+async def _run_concurrently(*coros):
+    """Await coroutines together; if one fails, cancel the rest before re-raising."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+def _group_steps(sequence):
+    """Split frozen steps into a tuple of groups that can be sent together."""
+    groups = []
+    for step in sequence:
+        if (
+            groups
+            and _parallel_safe(step)
+            and step[1][2]
+            and all(_parallel_safe(prev) and prev[1][0] != step[1][0] for prev in groups[-1])
+        ):
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+    return tuple(tuple(group) for group in groups)
+
+async def _do_tool(call, payload):
+    """Send one tool call to the robot server via a bound session.call_tool."""
+    tool_name, tool_args, _ = payload
+    if log.isEnabledFor(logging.DEBUG):
+        # Show args as the plain dict they came from, not the read-only proxy
+        log.debug("🔧 Executing: %s with args %s", tool_name, dict(tool_args))
+    # call_tool is used as is: send_request dumps and JSON-encodes every
+    # message itself, so pre-building request models would save no encoding.
+    result = await call(tool_name, arguments=tool_args)
+    log.debug("✅ Result: %s", result)
+
+async def _do_wait(call, wait_time):
+    """Pause the sequence."""
+    log.debug("⏳ Waiting for %s seconds...", wait_time)
+    await asyncio.sleep(wait_time)
+
+HANDLERS = {
+    STEP_TOOL: _do_tool,
+    STEP_WAIT: _do_wait,
+}
+
+@asynccontextmanager
+async def robot_session():
+    """Open one MCP session to the robot server, reusable across sequences and moves."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
     server_params = StdioServerParameters(
         command="python",
         args=["mcp_robot_server.py", "--transport", "stdio"],
         env=os.environ,
     )
 
-    try:
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
 
-                for step in sequence:
-                    if "wait" in step:
-                        wait_time = step["wait"]
-                        print(f"⏳ Waiting for {wait_time} seconds...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        tool_name = step["tool"]
-                        tool_args = step["args"]
+async def execute_robot_sequence(session, sequence):
+    """Execute a frozen (grouped) sequence of robot movements on an open MCP session."""
+    try:
+        # Bind hot lookups once instead of on every step
+        call = session.call_tool
+        sleep = asyncio.sleep
+        now = asyncio.get_running_loop().time
+        handlers = HANDLERS
 
-                        print(f"🔧 Executing: {tool_name} with args {tool_args}")
-                        result = await session.call_tool(tool_name, arguments=tool_args)
-                        print(f"✅ Result: {result}")
+        for group in sequence:
+            t_start = now()
+            if len(group) == 1:
+                kind, payload = group[0]
+                await handlers[kind](call, payload)
+            else:
+                await _run_concurrently(*(handlers[kind](call, payload) for kind, payload in group))
 
-                    await asyncio.sleep(0.3)  # Small delay between steps
+            # Let the arm settle, minus whatever the call already took
+            settle = max(_settle_time(step) for step in group)
+            remaining = settle - (now() - t_start)
+            if remaining > 0:
+                await sleep(remaining)
 
     except Exception as e:
-        print(f"❌ Error executing sequence: {e}")
+        log.error("❌ Error executing sequence: %s", e)
         raise
 
+# Home sequence: fixed lift/tilt/lower prefix, then per-square retract and un-rotate
+_HOME_HEAD = (
+    _step("move_robot", (("move_gripper_up_mm", "50"),)),
+    _step("move_robot", (("tilt_gripper_down_angle", "-80"),)),
+    _step("move_robot", (("move_gripper_up_mm", "-75"),)),
+)
+
+ROTATION_STEP = {
+    rotation: _step("move_robot", (("rotate_robot_right_angle", sys.intern(str(-rotation))),))
+    for rotation in set(ROTATIONS) if rotation
+}
+
+@lru_cache(maxsize=None)
+def _home_forward_step(forward_distance):
+    """Retract step for a given forward distance (one per distinct distance)."""
+    return _step("move_robot", (("move_gripper_forward_mm", sys.intern(f"-{forward_distance}")),))
+
 def create_home_sequence(forward_distance, rotation_angle):
     """Generate home sequence with specified forward distance and rotation reset."""
-    rotation_reset = -rotation_angle if rotation_angle != 0 else 0
-    
-    home_sequence = [   
-        {"tool": "move_robot", "args": {"move_gripper_up_mm": "50"}},
-        {"tool": "move_robot", "args": {"tilt_gripper_down_angle": "-80"}},
-        {"tool": "move_robot", "args": {"move_gripper_up_mm": "-75"}},
-        {"tool": "move_robot", "args": {"move_gripper_forward_mm": f"-{forward_distance}"}}
-    ]
+    home_sequence = _HOME_HEAD + (_home_forward_step(forward_distance),)
     
     # Add rotation reset if needed
-    if rotation_reset != 0:
-        home_sequence.append({"tool": "move_robot", "args": {"rotate_robot_right_angle": str(rotation_reset)}})
+    if rotation_angle:
+        home_sequence += (ROTATION_STEP[rotation_angle],)
     
     return home_sequence
 
-async def execute_command_sequence(command_name, commands):
+# Home sequences for every square, built once instead of on each move
+HOME_SEQUENCES = tuple(_group_steps(create_home_sequence(*square_geometry(sq_id))) for sq_id in range(64))
+
+async def execute_command_sequence(session, command_name, commands):
     """Execute a specific command from the JSON file."""
-    if command_name not in commands:
-        print(f"❌ Error: Command '{command_name}' not found in JSON")
+    sequence = commands.named.get(command_name)
+    if sequence is None:
+        log.error("❌ Error: Command '%s' not found in JSON", command_name)
         return
     
-    print(f"\n🎯 --- Executing: {command_name.upper()} ---")
-    await execute_robot_sequence(commands[command_name])
+    log.info("\n🎯 --- Executing: %s ---", command_name.upper())
+    await execute_robot_sequence(session, sequence)
+
+async def execute_square_sequence(session, sq_id, commands):
+    """Execute the JSON sequence for a square given by its _sqid()."""
+    square_name = _square_name(sq_id)
+    sequence = commands.squares[sq_id]
+    if sequence is None:
+        log.error("❌ Error: Command '%s' not found in JSON", square_name)
+        return
+    
+    log.info("\n🎯 --- Executing: %s ---", square_name.upper())
+    await execute_robot_sequence(session, sequence)
 
 def validate_position(position):
     """Validate chess position format and availability."""
+    if position in VALID_POSITIONS:
+        return True, "Valid"
+    
+    # Slow path only to build a helpful error message
     if len(position) != 2:
         return False, "Invalid position format. Use format like 'd7', 'e5', etc."
     
@@ -161,85 +309,89 @@ def validate_position(position):
     if position[1] not in '12345678':
         return False, f"Invalid row '{position[1]}'. Must be 1-8."
     
-    if position not in POSITION_DATA:
-        return False, f"Position '{position}' not available in position data."
-    
-    return True, "Valid"
+    return False, f"Position '{position}' not available in position data."
 
-async def move_chess_piece(from_position, to_position):
+async def move_chess_piece(from_id, to_id):
     """
     Execute complete chess piece movement following the exact sequence:
     attack → open → from_position → close → home → attack → to_position → open → home → close → move_for_cam
+    
+    Squares are given as ids from _sqid().
     """
+    from_position, to_position = _square_name(from_id), _square_name(to_id)
     
     # Load command sequences from JSON
     try:
-        with open('command.json', 'r') as file:
-            commands = json.load(file)
+        commands = _load_commands(os.path.getmtime(COMMANDS_FILE))
     except FileNotFoundError:
         print("❌ Error: command.json file not found")
         return
-    except json.JSONDecodeError:
+    except ValueError:  # JSONDecodeError, bad step shape, or mmap of an empty file
         print("❌ Error: Invalid JSON format in command.json")
         return
     
     # Validate positions exist in commands
-    if from_position not in commands:
+    if commands.squares[from_id] is None:
         print(f"❌ Error: Position '{from_position}' not found in commands.json")
         return
     
-    if to_position not in commands:
+    if commands.squares[to_id] is None:
         print(f"❌ Error: Position '{to_position}' not found in commands.json")
         return
     
     # Get position data
-    from_data = POSITION_DATA[from_position]
-    to_data = POSITION_DATA[to_position]
+    from_forward, from_rotation = square_geometry(from_id)
+    to_forward, to_rotation = square_geometry(to_id)
     
     print(f"🚀 Starting chess move: {from_position.upper()} → {to_position.upper()}")
     print("=" * 70)
-    print(f"📍 From position: {from_position.upper()} (Forward: {from_data['forward']}mm, Rotation: {from_data['rotation']}°)")
-    print(f"📍 To position: {to_position.upper()} (Forward: {to_data['forward']}mm, Rotation: {to_data['rotation']}°)")
+    print(f"📍 From position: {from_position.upper()} (Forward: {from_forward}mm, Rotation: {from_rotation}°)")
+    print(f"📍 To position: {to_position.upper()} (Forward: {to_forward}mm, Rotation: {to_rotation}°)")
     print("=" * 70)
     
     try:
-        # STEP 1: Attack position
-        await execute_command_sequence("attack", commands)
-        
-        # STEP 2: Open gripper (prepare for picking)
-        await execute_command_sequence("open", commands)
-        
-        # STEP 3: Move to source position
-        await execute_command_sequence(from_position, commands)
-        
-        # STEP 4: Close gripper (pick up piece)
-        await execute_command_sequence("close", commands)
-        
-        # STEP 5: Home (return to home with piece)
-        print(f"\n🏠 --- Executing: HOME (from {from_position.upper()}) ---")
-        home_sequence = create_home_sequence(from_data["forward"], from_data["rotation"])
-        await execute_robot_sequence(home_sequence)
-        
-        # STEP 6: Attack position (again)
-        await execute_command_sequence("attack", commands)
-        
-        # STEP 7: Move to destination position
-        await execute_command_sequence(to_position, commands)
-        
-        # STEP 8: Open gripper (drop piece)
-        await execute_command_sequence("open", commands)
-        
-        # STEP 9: Home (return to home position)
-        print(f"\n🏠 --- Executing: HOME (from {to_position.upper()}) ---")
-        home_sequence = create_home_sequence(to_data["forward"], to_data["rotation"])
-        await execute_robot_sequence(home_sequence)
-        
-        # STEP 10: Close gripper (final position)
-        await execute_command_sequence("close", commands)
-        
-        # STEP 11: Move for camera
-        await execute_command_sequence("move_for_cam", commands)
-        
+        async with robot_session() as session:
+            # STEP 1: Attack position
+            await execute_command_sequence(session, "attack", commands)
+            
+            # STEP 2: Open gripper (prepare for picking)
+            await execute_command_sequence(session, "open", commands)
+            
+            # STEP 3: Move to source position
+            await execute_square_sequence(session, from_id, commands)
+            
+            # STEP 4: Close gripper (pick up piece)
+            await execute_command_sequence(session, "close", commands)
+            
+            # STEP 5: Home (return to home with piece)
+            log.info("\n🏠 --- Executing: HOME (from %s) ---", from_position.upper())
+            await execute_robot_sequence(session, HOME_SEQUENCES[from_id])
+            
+            # STEP 6: Attack position (again)
+            await execute_command_sequence(session, "attack", commands)
+            
+            # STEP 7: Move to destination position
+            await execute_square_sequence(session, to_id, commands)
+            
+            # STEP 8: Open gripper (drop piece)
+            await execute_command_sequence(session, "open", commands)
+            
+            # STEP 9: Home (return to home position)
+            log.info("\n🏠 --- Executing: HOME (from %s) ---", to_position.upper())
+            await execute_robot_sequence(session, HOME_SEQUENCES[to_id])
+            
+            # STEP 10 + 11: Close gripper (final position) and move for camera.
+            # The piece is already released, so the gripper may close while
+            # the arm moves, as long as the two never share an actuator.
+            if _can_overlap(commands.named.get("close", ()), commands.named.get("move_for_cam", ())):
+                await _run_concurrently(
+                    execute_command_sequence(session, "close", commands),
+                    execute_command_sequence(session, "move_for_cam", commands),
+                )
+            else:
+                await execute_command_sequence(session, "close", commands)
+                await execute_command_sequence(session, "move_for_cam", commands)
+            
         print(f"\n🎉 Successfully completed chess move: {from_position.upper()} → {to_position.upper()}")
         print("=" * 70)
         
@@ -247,13 +399,14 @@ async def move_chess_piece(from_position, to_position):
         print(f"❌ Error during chess move: {e}")
         raise
 
-def print_usage():
-    """Print comprehensive usage instructions."""
-    print("🏛️  Chess Robot Controller")
-    print("=" * 50)
-    print("📋 Usage: python app.py <from_position> <to_position>")
-    print("📋 Example: python app.py d7 d5")
-    print("\n📍 Available positions (all 64 squares):")
+def _write_usage(out):
+    """Write comprehensive usage instructions to a text stream."""
+    print("🏛️  Chess Robot Controller", file=out)
+    print("=" * 50, file=out)
+    print("📋 Usage: python app.py <from_position> <to_position>", file=out)
+    print("📋 Example: python app.py d7 d5", file=out)
+    print("📋 Step-by-step output: ROBOT_LOG=DEBUG python app.py d7 d5", file=out)
+    print("\n📍 Available positions (all 64 squares):", file=out)
     
     # Print positions in a chess board layout
     rows = ['8', '7', '6', '5', '4', '3', '2', '1']
@@ -261,29 +414,39 @@ def print_usage():
     
     for row in rows:
         row_positions = [f"{col}{row}" for col in cols]
-        print(f"   {row}: {' '.join(row_positions)}")
+        print(f"   {row}: {' '.join(row_positions)}", file=out)
     
-    print("\n🔄 Movement sequence executed:")
-    print("   1. attack → 2. open → 3. from_position → 4. close → 5. home")
-    print("   6. attack → 7. to_position → 8. open → 9. home → 10. close → 11. move_for_cam")
+    print("\n🔄 Movement sequence executed:", file=out)
+    print("   1. attack → 2. open → 3. from_position → 4. close → 5. home", file=out)
+    print("   6. attack → 7. to_position → 8. open → 9. home → 10. close → 11. move_for_cam", file=out)
     
-    print("\n🎯 Robot configuration:")
-    print("   • Board: 260mm x 260mm (33mm per square)")
-    print("   • Robot: SO-101 with 6 DOF")
-    print("   • Position: 2cm from D column edge")
-    print("   • Rotation: Automatic based on target column")
+    print("\n🎯 Robot configuration:", file=out)
+    print("   • Board: 260mm x 260mm (33mm per square)", file=out)
+    print("   • Robot: SO-101 with 6 DOF", file=out)
+    print("   • Position: 2cm from D column edge", file=out)
+    print("   • Rotation: Automatic based on target column", file=out)
+
+# Usage text never changes, so format it once at import
+_usage_buf = io.StringIO()
+_write_usage(_usage_buf)
+_USAGE_STR = _usage_buf.getvalue()
+del _usage_buf
+
+def print_usage():
+    """Print comprehensive usage instructions."""
+    sys.stdout.write(_USAGE_STR)
 
 def print_position_info(position):
     """Print detailed information about a specific position."""
-    if position in POSITION_DATA:
-        data = POSITION_DATA[position]
+    if position in VALID_POSITIONS:
+        forward, rotation = square_geometry(_sqid(position))
         print(f"\n📍 Position {position.upper()} details:")
-        print(f"   Forward distance: {data['forward']}mm")
-        print(f"   Rotation angle: {data['rotation']}°")
+        print(f"   Forward distance: {forward}mm")
+        print(f"   Rotation angle: {rotation}°")
         column = position[0]
-        if data['rotation'] == 0:
+        if rotation == 0:
             print(f"   Column {column.upper()}: Direct alignment (no rotation)")
-        elif data['rotation'] < 0:
+        elif rotation < 0:
             print(f"   Column {column.upper()}: Left rotation")
         else:
             print(f"   Column {column.upper()}: Right rotation")
@@ -297,8 +460,7 @@ async def main():
         print_usage()
         return
     
-    from_position = sys.argv[1].lower()
-    to_position = sys.argv[2].lower()
+    from_position, to_position = (arg.lower() for arg in sys.argv[1:])
     
     # Validate positions
     from_valid, from_msg = validate_position(from_position)
@@ -318,6 +480,9 @@ async def main():
         print("❌ Error: From and to positions cannot be the same\n")
         return
     
+    # Validated squares are handled as ids from here on
+    from_id, to_id = _sqid(from_position), _sqid(to_position)
+    
     print("🤖 Chess Robot Controller - Move Execution")
     print("=" * 50)
     print_position_info(from_position)
@@ -326,9 +491,17 @@ async def main():
     print("=" * 50)
     
     # Execute the chess move
-    await move_chess_piece(from_position, to_position)
+    await move_chess_piece(from_id, to_id)
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    # Unknown ROBOT_LOG values fall back to INFO instead of crashing the CLI
+    log_level = logging.getLevelName(os.environ.get("ROBOT_LOG", "INFO").upper())
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+    logging.basicConfig(level=log_level, format="%(message)s", stream=sys.stdout)
     try:
         asyncio.run(main())
     except KeyboardInterrupt: